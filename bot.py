@@ -5,19 +5,46 @@ A feature-rich bot for GIF searches, reactions, and fun interactions
 """
 
 import os
-import json
+import sys
+import time
 import asyncio
 import logging
 import random
 import re
+import heapq
+from itertools import islice
+
+import aiohttp
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Dict, List, Optional
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+
+try:
+    import orjson
+
+    def _json_loads(raw):
+        return orjson.loads(raw)
+
+    def _json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    # Fall back to stdlib json so the bot still boots without orjson;
+    # default=str covers the datetime objects orjson handles natively
+    import json
 
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+    def _json_loads(raw):
+        return json.loads(raw)
+
+    def _json_dumps(data):
+        return json.dumps(data, default=str).encode()
+
+from telegram import (
+    Update, InlineKeyboardButton, InlineKeyboardMarkup
+)
 from telegram.ext import (
-    Application, CommandHandler, MessageHandler, 
-    CallbackQueryHandler, ContextTypes, filters
+    AIORateLimiter, Application, CommandHandler, MessageHandler,
+    CallbackQueryHandler, ChatMemberHandler, ContextTypes, filters
 )
 from telegram.constants import ChatAction
 from dotenv import load_dotenv
@@ -44,183 +71,107 @@ logging.basicConfig(
 )
 logger = logging.getLogger("GIF_Bot")
 
-class GIFBot:
-    """Advanced Telegram GIF Bot with comprehensive features"""
-    
-    def __init__(self):
-        self.tenor = TenorAPI()
-        self.enhanced = EnhancedFeatures(self)
-        self.user_stats = defaultdict(int)
-        self.group_settings = defaultdict(lambda: {
-            'passive_mode': False,
-            'max_gifs': 3,
-            'safe_mode': True
-        })
-        self.favorites = defaultdict(list)
-        self.collections = defaultdict(dict)  # user_id: {collection_name: [gif_ids]}
-        self.gif_labels = {}
-        self.scheduled_tasks = {}
-        self.challenges = {}
-        
-        # Passive mode triggers
-        self.triggers = {
-            'lol': ['funny', 'laugh', 'lmao'],
-            'bruh': ['facepalm', 'really', 'seriously'],
-            'sad': ['crying', 'tear', 'depression'],
-            'happy': ['celebration', 'joy', 'party'],
-            'angry': ['mad', 'rage', 'furious'],
-            'love': ['heart', 'romance', 'cute'],
-            'wow': ['amazed', 'surprised', 'mind blown'],
-            'tired': ['sleepy', 'exhausted', 'yawn']
-        }
-        
-        # Quick reactions mapping
-        self.quick_reactions = {
-            "😂": "laughing",
-            "😍": "love",
-            "😢": "crying",
-            "😡": "angry",
-            "🤯": "mind blown",
-            "👍": "thumbs up",
-            "👎": "thumbs down",
-            "🎉": "celebration",
-            "💩": "fail",
-            "💋": "kiss",
-            "🤗": "hug",
-            "🤔": "thinking",
-            "🤫": "shh",
-            "🫠": "melting"
-        }
-        
-        # Command reactions mapping
-        self.command_reactions = {
-            "start": "👋",
-            "about": "ℹ️",
-            "help": "📖",
-            "s": "🔍",
-            "r": "🎲",
-            "fav_add": "⭐",
-            "fav_list": "📋",
-            "fav_remove": "🗑️",
-            "newcollection": "📂",
-            "addtocollection": "➕",
-            "collections": "📚",
-            "showcollection": "🖼️",
-            "react": "⚡",
-            "meme": "😂",
-            "quote": "✨",
-            "challenge": "🏆",
-            "submitgif": "📤",
-            "schedule": "⏰",
-            "toggle_passive": "🤖",
-            "setmax": "🔢",
-            "safe": "🔒",
-            "stats": "📊",
-            "ranking": "🏆",
-            "cancelchallenge": "❌"
-        }
-        
-        self.load_data()
-    
-    def load_data(self):
-        """Load persistent data from files"""
-        try:
-            if os.path.exists('bot_data.json'):
-                with open('bot_data.json', 'r') as f:
-                    data = json.load(f)
-                    self.user_stats = defaultdict(int, data.get('user_stats', {}))
-                    self.group_settings = defaultdict(
-                        lambda: {'passive_mode': False, 'max_gifs': 3, 'safe_mode': True},
-                        data.get('group_settings', {})
-                    )
-                    self.favorites = defaultdict(list, data.get('favorites', {}))
-                    self.collections = defaultdict(dict, data.get('collections', {}))
-                    self.gif_labels = data.get('gif_labels', {})
-                    self.challenges = data.get('challenges', {})
-        except Exception as e:
-            logger.error(f"Error loading data: {e}")
-    
-    def save_data(self):
-        """Save persistent data to file"""
-        try:
-            data = {
-                'user_stats': dict(self.user_stats),
-                'group_settings': dict(self.group_settings),
-                'favorites': dict(self.favorites),
-                'collections': dict(self.collections),
-                'gif_labels': self.gif_labels,
-                'challenges': self.challenges
-            }
-            with open('bot_data.json', 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving data: {e}")
-    
-    async def react_to_command(self, update: Update, command: str):
-        """React to command with appropriate emoji"""
-        try:
-            emoji = self.command_reactions.get(command, "👍")
-            await update.message.reply_text(emoji)
-        except Exception as e:
-            logger.error(f"Error reacting to command: {e}")
-    
-    def log_command(self, update: Update, command: str, query: str = ""):
-        """Log command usage with rich formatting"""
-        user = update.effective_user
-        chat = update.effective_chat
-        
-        # Create user info
-        user_info = f"{user.first_name}"
-        if user.username:
-            user_info += f" (@{user.username})"
-        user_info += f" [ID: {user.id}]"
-        
-        # Create chat info
-        chat_info = "Private Chat" if chat.type == "private" else f"Group: {chat.title}"
-        
-        # Create table for command log
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column("Label", style="bold cyan")
-        table.add_column("Value", style="white")
-        
-        table.add_row("Command:", f"/{command}")
-        table.add_row("User:", user_info)
-        table.add_row("Chat:", chat_info)
-        if query:
-            table.add_row("Query:", query)
-        table.add_row("Time:", datetime.now().strftime("%H:%M:%S"))
-        
-        console.print(Panel(table, title="[green]Bot Activity[/green]", 
-                          border_style="green"))
-    
-    def _get_reply_id(self, update: Update) -> Optional[int]:
-        """Get message ID to reply to if user is replying to someone"""
-        if update.message and update.message.reply_to_message:
-            return update.message.reply_to_message.message_id
-        return None
-    
-    async def _send_gif(
-        self, 
-        context: ContextTypes.DEFAULT_TYPE,
-        chat_id: int,
-        gif_url: str, 
-        caption: str,
-        reply_id: Optional[int] = None
-    ):
-        """Send GIF with proper reply handling"""
-        await context.bot.send_animation(
-            chat_id=chat_id,
-            animation=gif_url,
-            caption=caption,
-            reply_to_message_id=reply_id
-        )
-    
-    async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Welcome message with features overview"""
-        await self.react_to_command(update, "start")
-        self.log_command(update, "start")
-        
-        welcome_text = """
+# Seconds to wait after a change before flushing state to disk
+SAVE_FLUSH_INTERVAL = 5
+
+# How long Tenor search results stay valid in the in-memory cache,
+# and how many entries to keep before evicting the least recently used
+TENOR_CACHE_TTL = 600
+TENOR_CACHE_MAX = 1024
+
+# How long a cached admin-status lookup stays valid
+ADMIN_CACHE_TTL = 60
+
+# How long a fetched inspirational quote is reused before hitting the API
+QUOTE_TTL = 60
+
+# Read-only settings used for chats that never changed anything;
+# writers go through the group_settings defaultdict instead
+DEFAULT_GROUP_SETTINGS = MappingProxyType({
+    'passive_mode': False,
+    'max_gifs': 3,
+    'safe_mode': True
+})
+
+# Passive-mode trigger words and their candidate search queries.
+# Immutable tuples of interned strings shared by every lookup
+TRIGGERS = tuple(
+    (sys.intern(trigger), tuple(map(sys.intern, queries)))
+    for trigger, queries in (
+        ('lol', ('funny', 'laugh', 'lmao')),
+        ('bruh', ('facepalm', 'really', 'seriously')),
+        ('sad', ('crying', 'tear', 'depression')),
+        ('happy', ('celebration', 'joy', 'party')),
+        ('angry', ('mad', 'rage', 'furious')),
+        ('love', ('heart', 'romance', 'cute')),
+        ('wow', ('amazed', 'surprised', 'mind blown')),
+        ('tired', ('sleepy', 'exhausted', 'yawn'))
+    )
+)
+
+# /schedule time argument, HH:MM 24-hour
+HHMM_RE = re.compile(r"^([0-1]?[0-9]|2[0-3]):([0-5][0-9])$")
+
+# Frozen dict view of TRIGGERS for the match -> queries lookup
+TRIGGERS_MAP = MappingProxyType(dict(TRIGGERS))
+
+# Quick reactions mapping (emoji -> search query)
+QUICK_REACTIONS = MappingProxyType({
+    "😂": "laughing",
+    "😍": "love",
+    "😢": "crying",
+    "😡": "angry",
+    "🤯": "mind blown",
+    "👍": "thumbs up",
+    "👎": "thumbs down",
+    "🎉": "celebration",
+    "💩": "fail",
+    "💋": "kiss",
+    "🤗": "hug",
+    "🤔": "thinking",
+    "🤫": "shh",
+    "🫠": "melting"
+})
+
+# Command reactions mapping (command -> ack emoji)
+COMMAND_REACTIONS = MappingProxyType({
+    "start": "👋",
+    "about": "ℹ️",
+    "help": "📖",
+    "s": "🔍",
+    "r": "🎲",
+    "fav_add": "⭐",
+    "fav_list": "📋",
+    "fav_remove": "🗑️",
+    "newcollection": "📂",
+    "addtocollection": "➕",
+    "collections": "📚",
+    "showcollection": "🖼️",
+    "react": "⚡",
+    "meme": "😂",
+    "quote": "✨",
+    "challenge": "🏆",
+    "submitgif": "📤",
+    "schedule": "⏰",
+    "toggle_passive": "🤖",
+    "setmax": "🔢",
+    "safe": "🔒",
+    "stats": "📊",
+    "ranking": "🏆",
+    "cancelchallenge": "❌"
+})
+
+# All triggers compiled into one pattern so each message costs a single
+# C-level scan; word boundaries stop "lollipop" matching "lol". Shared by
+# the PTB filter layer and the handler itself
+TRIGGER_RE = re.compile(
+    r'\b(' + '|'.join(trigger for trigger, _ in TRIGGERS) + r')\b',
+    re.IGNORECASE
+)
+
+# Static texts and keyboards built once at import time instead of
+# per command invocation
+WELCOME_TEXT = """
 👋 Welcome to the Ultimate GIF Bot!
 
 I'm here to make your chats more fun with GIFs! Here's what I can do:
@@ -254,114 +205,60 @@ I'm here to make your chats more fun with GIFs! Here's what I can do:
 📆 Schedule Fun:
 /schedule [HH:MM] [query] - Schedule GIF posts
 
-👉 Add me to your groups to spread the fun! 
+👉 Add me to your groups to spread the fun!
 Just search for me in Telegram and click "Add to Group"
 
 Use /help for detailed command info!
         """
-        
-        await update.message.reply_text(welcome_text)
-        
-        # Send welcome GIF
-        try:
-            welcome_gif = await self.tenor.search_gif("hello", limit=1)
-            if welcome_gif:
-                await update.message.reply_animation(
-                    welcome_gif[0],
-                    caption="Let's get started! What GIF adventure shall we begin today?"
-                )
-        except Exception as e:
-            logger.error(f"Error sending welcome GIF: {e}")
-    
-    async def group_welcome(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Send welcome message when bot is added to a group"""
-        if update.message.new_chat_members:
-            for member in update.message.new_chat_members:
-                if member.id == context.bot.id:
-                    await update.message.reply_text(
-                        "👋 Hey everyone! Thanks for adding me to the group!\n\n"
-                        "I'm the Ultimate GIF Bot - here to make your chats more fun with GIFs!\n\n"
-                        "Here's what I can do:\n"
-                        "- Search GIFs with /s [query]\n"
-                        "- Save favorites with /fav_add\n"
-                        "- Start challenges with /challenge\n"
-                        "- And much more!\n\n"
-                        "Use /help to see all commands. Let's have some fun! 🎉"
-                    )
-                    # Send welcome GIF
-                    try:
-                        welcome_gif = await self.tenor.search_gif("group hello", limit=1)
-                        if welcome_gif:
-                            await update.message.reply_animation(welcome_gif[0])
-                    except Exception:
-                        pass
-    
-    async def about(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Show information about the bot creator"""
-        await self.react_to_command(update, "about")
-        self.log_command(update, "about")
-        
-        about_text = """
+
+GROUP_WELCOME_TEXT = (
+    "👋 Hey everyone! Thanks for adding me to the group!\n\n"
+    "I'm the Ultimate GIF Bot - here to make your chats more fun with GIFs!\n\n"
+    "Here's what I can do:\n"
+    "- Search GIFs with /s [query]\n"
+    "- Save favorites with /fav_add\n"
+    "- Start challenges with /challenge\n"
+    "- And much more!\n\n"
+    "Use /help to see all commands. Let's have some fun! 🎉"
+)
+
+ABOUT_TEXT = """
 👋 Hey there!
 
-I'm Suppy 🧑‍💻 — the creator of this bot! 
+I'm Suppy 🧑‍💻 — the creator of this bot!
 
-💖 This bot was created just for fun as a personal project. 
+💖 This bot was created just for fun as a personal project.
 No business stuff, just pure GIF joy! 🎉
 
-🎯 Why I made this?  
-I wanted a cool way to share laughs and reactions with friends! 
+🎯 Why I made this?
+I wanted a cool way to share laughs and reactions with friends!
 Life's too short for boring chats, right? 😄
 
-📌 Important Note:  
-I might not be actively maintaining this bot forever, 
+📌 Important Note:
+I might not be actively maintaining this bot forever,
 but as long as it's running, feel free to enjoy it! 🚀
 
-🙏 Big Thanks!  
-Seriously, thanks for checking out my creation! 
+🙏 Big Thanks!
+Seriously, thanks for checking out my creation!
 If you have a moment, share a GIF that makes you smile with /s happy 😊
 
 👉 My username: @Suppyee
         """
-        
-        await update.message.reply_text(about_text)
-        
-        # Send a thank you GIF
-        try:
-            thanks_gif = await self.tenor.search_gif("thank you", limit=1)
-            if thanks_gif:
-                await update.message.reply_animation(
-                    thanks_gif[0],
-                    caption="Thanks for being awesome!"
-                )
-        except Exception as e:
-            logger.error(f"Error sending thanks GIF: {e}")
-    
-    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Detailed help with interactive buttons"""
-        await self.react_to_command(update, "help")
-        self.log_command(update, "help")
-        
-        keyboard = [
-            [InlineKeyboardButton("🔍 Search & Find", callback_data="help_search")],
-            [InlineKeyboardButton("⭐ Favorites & Collections", callback_data="help_favorites")],
-            [InlineKeyboardButton("🎮 Fun & Games", callback_data="help_fun")],
-            [InlineKeyboardButton("⚡ Quick Reactions", callback_data="help_reactions")],
-            [InlineKeyboardButton("⚙️ Settings & Admin", callback_data="help_admin")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        help_text = "🌈 GIF Bot Help Center\n\nChoose a category to learn more:"
-        
-        await update.message.reply_text(help_text, reply_markup=reply_markup)
-    
-    async def help_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle help category selections"""
-        query = update.callback_query
-        await query.answer()
-        
-        help_texts = {
-            "help_search": """
+
+HELP_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔍 Search & Find", callback_data="help_search")],
+    [InlineKeyboardButton("⭐ Favorites & Collections", callback_data="help_favorites")],
+    [InlineKeyboardButton("🎮 Fun & Games", callback_data="help_fun")],
+    [InlineKeyboardButton("⚡ Quick Reactions", callback_data="help_reactions")],
+    [InlineKeyboardButton("⚙️ Settings & Admin", callback_data="help_admin")]
+])
+
+HELP_BACK_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔙 Back to Main Help", callback_data="help_main")]
+])
+
+HELP_TEXTS = {
+    "help_search": """
 🔍 Search & Find GIFs
 
 /s [query] - Find the perfect GIF
@@ -377,8 +274,8 @@ Example: /r celebration
 /quote [topic] - Get motivational quote + matching GIF
 Example: /quote success
             """,
-            
-            "help_favorites": """
+
+    "help_favorites": """
 ⭐ Favorites & Collections
 
 /fav_add - Reply to any GIF to save it
@@ -395,8 +292,8 @@ Example: /addtocollection Cats
 /collections - List your collections
 /showcollection [name] - Show GIFs in a collection
             """,
-            
-            "help_fun": """
+
+    "help_fun": """
 🎮 Fun & Games
 
 /challenge [theme] [seconds] - Start a GIF challenge!
@@ -411,8 +308,8 @@ Reply to a GIF with this command
 /schedule [HH:MM] [query] - Schedule GIF posts
 Example: /schedule 14:30 celebration
             """,
-            
-            "help_reactions": """
+
+    "help_reactions": """
 ⚡ Quick Reactions
 
 /react [emoji] - Send reaction GIF instantly!
@@ -434,8 +331,8 @@ Available emojis:
 
 Example: /react 😂
             """,
-            
-            "help_admin": """
+
+    "help_admin": """
 ⚙️ Settings & Admin
 
 /toggle_passive - Enable/disable auto-reactions
@@ -450,17 +347,351 @@ Example: /setmax 2
 
 Note: Group admin commands work in groups only
             """
+}
+
+class GIFBot:
+    """Advanced Telegram GIF Bot with comprehensive features"""
+    
+    def __init__(self):
+        self.tenor = TenorAPI()
+        self.enhanced = EnhancedFeatures(self)
+        self.user_stats = defaultdict(int)
+        self.group_settings = defaultdict(lambda: {
+            'passive_mode': False,
+            'max_gifs': 3,
+            'safe_mode': True
+        })
+        self.favorites = defaultdict(list)
+        self._fav_sets = defaultdict(set)  # mirrors favorites for O(1) membership
+        self.collections = defaultdict(dict)  # user_id: {collection_name: [gif_ids]}
+        self.gif_labels = {}
+        self.challenges = {}
+
+        # Dirty flag + background flush task so every command doesn't
+        # rewrite bot_data.json on its own
+        self._dirty = asyncio.Event()
+        self._save_task = None
+
+        # Recent Tenor results keyed by (query, limit, safe_search);
+        # ordered so the oldest entry can be evicted LRU-style
+        self._tenor_cache = OrderedDict()
+
+        # Cached admin checks keyed by (chat_id, user_id)
+        self._admin_cache = {}
+
+        # In-flight Tenor searches so concurrent identical queries share
+        # one request instead of fanning out
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
+        # Shared aiohttp session (non-Tenor calls) and the last fetched
+        # quote so /quote bursts don't hammer the quote API
+        self._http = None
+        self._quote_cache = (0.0, "")
+
+        # Per-chat queues keep passive replies ordered within a chat
+        # while chats stay independent of each other
+        self._chat_queues: Dict[int, asyncio.Queue] = {}
+        self._chat_workers: Dict[int, asyncio.Task] = {}
+        
+        # Chats with passive mode on, so the per-message handler can
+        # bail with one set lookup (rebuilt by load_data below)
+        self._passive_chats = set()
+
+        # Read-only lookup tables shared at module level
+        self.triggers = TRIGGERS_MAP
+        self.quick_reactions = QUICK_REACTIONS
+        self.command_reactions = COMMAND_REACTIONS
+
+        self.load_data()
+    
+    def load_data(self):
+        """Load persistent data from files"""
+        try:
+            if os.path.exists('bot_data.json'):
+                with open('bot_data.json', 'rb') as f:
+                    data = _json_loads(f.read())
+                    # JSON forces string keys; convert back so handlers can
+                    # index with the raw int IDs Telegram hands us
+                    self.user_stats = defaultdict(
+                        int, {int(k): v for k, v in data.get('user_stats', {}).items()}
+                    )
+                    self.group_settings = defaultdict(
+                        lambda: {'passive_mode': False, 'max_gifs': 3, 'safe_mode': True},
+                        {int(k): v for k, v in data.get('group_settings', {}).items()}
+                    )
+                    self.favorites = defaultdict(
+                        list, {int(k): v for k, v in data.get('favorites', {}).items()}
+                    )
+                    self._fav_sets = defaultdict(
+                        set, {uid: set(favs) for uid, favs in self.favorites.items()}
+                    )
+                    self.collections = defaultdict(
+                        dict, {int(k): v for k, v in data.get('collections', {}).items()}
+                    )
+                    self._passive_chats = {
+                        cid for cid, settings in self.group_settings.items()
+                        if settings.get('passive_mode')
+                    }
+                    self.gif_labels = {int(k): v for k, v in data.get('gif_labels', {}).items()}
+                    self.challenges = {
+                        int(k): dict(v, participants={
+                            int(uid): gif for uid, gif in v.get('participants', {}).items()
+                        })
+                        for k, v in data.get('challenges', {}).items()
+                    }
+        except Exception as e:
+            logger.error(f"Error loading data: {e}")
+    
+    def save_data(self):
+        """Mark state as dirty - the background task flushes it to disk"""
+        self._dirty.set()
+
+    def _serialize(self) -> bytes:
+        """Serialize state to JSON bytes. Runs on the event loop thread so
+        handlers can't mutate the dicts mid-dump; orjson walks the
+        defaultdicts in place without copying them first"""
+        data = {
+            'user_stats': self.user_stats,
+            'group_settings': self.group_settings,
+            'favorites': self.favorites,
+            'collections': self.collections,
+            'gif_labels': self.gif_labels,
+            'challenges': self.challenges
         }
+        return _json_dumps(data)
+
+    def _write_json(self, payload: bytes):
+        """Write serialized state to bot_data.json (runs in a worker thread)"""
+        try:
+            # Write to a temp file and swap it in so a crash mid-write
+            # can't corrupt the data file
+            with open('bot_data.json.tmp', 'wb') as f:
+                f.write(payload)
+            os.replace('bot_data.json.tmp', 'bot_data.json')
+        except Exception as e:
+            logger.error(f"Error saving data: {e}")
+
+    async def _save_loop(self):
+        """Coalesce save requests and flush at most once per interval"""
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(SAVE_FLUSH_INTERVAL)
+            self._dirty.clear()
+            try:
+                await asyncio.to_thread(self._write_json, self._serialize())
+            except Exception as e:
+                # Keep the loop alive; a dead flush task would turn every
+                # later save_data() into a silent no-op
+                logger.error(f"Error flushing data: {e}")
+
+    async def post_init(self, application):
+        """Start background tasks once the event loop is running"""
+        self._save_task = asyncio.create_task(self._save_loop())
+        self.enhanced.start_background_tasks()
+
+    async def post_shutdown(self, application):
+        """Stop the save task and flush any pending changes"""
+        if self._save_task:
+            self._save_task.cancel()
+            # Wait it out so an in-flight write can't race the final flush
+            try:
+                await self._save_task
+            except asyncio.CancelledError:
+                pass
+        self.enhanced.stop_background_tasks()
+        if self._http and not self._http.closed:
+            await self._http.close()
+        await self.tenor.close()
+        if self._dirty.is_set():
+            await asyncio.to_thread(self._write_json, self._serialize())
+
+    async def _get_http(self):
+        """Get or create the shared aiohttp session for non-Tenor calls"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession()
+        return self._http
+
+    async def _fetch_quote(self) -> str:
+        """Fetch a random quote, reusing the last one within a short TTL"""
+        now = time.monotonic()
+        fetched_at, cached = self._quote_cache
+        if cached and now - fetched_at < QUOTE_TTL:
+            return cached
+
+        session = await self._get_http()
+        async with session.get("https://api.quotable.io/random", timeout=5) as response:
+            if response.status == 200:
+                data = await response.json()
+                quote_text = f'"{data["content"]}" — {data["author"]}'
+                self._quote_cache = (now, quote_text)
+                return quote_text
+        return "Believe you can and you're halfway there."
+    
+    def chat_settings(self, chat_id) -> Dict:
+        """Settings for a chat, without materializing a new entry on reads"""
+        return self.group_settings.get(chat_id, DEFAULT_GROUP_SETTINGS)
+
+    async def cached_search(self, query: str, limit: int = 1, safe_search: bool = True) -> List[str]:
+        """Search Tenor, reusing recent results for identical queries"""
+        key = (query.lower(), limit, safe_search)
+        now = time.monotonic()
+        cached = self._tenor_cache.get(key)
+        if cached and now - cached[0] < TENOR_CACHE_TTL:
+            self._tenor_cache.move_to_end(key)
+            return cached[1]
+
+        # Coalesce cold-cache stampedes (e.g. ten users typing "lol" at
+        # once) onto a single shared request
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self.tenor.search_gif(query, limit=limit, safe_search=safe_search)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+
+        gifs = await task
+        if gifs:
+            self._tenor_cache[key] = (now, gifs)
+            self._tenor_cache.move_to_end(key)
+            if len(self._tenor_cache) > TENOR_CACHE_MAX:
+                self._tenor_cache.popitem(last=False)
+        return gifs
+
+    async def react_to_command(self, update: Update, command: str):
+        """React to command with appropriate emoji"""
+        try:
+            emoji = self.command_reactions.get(command, "👍")
+            await update.message.reply_text(emoji)
+        except Exception as e:
+            logger.error(f"Error reacting to command: {e}")
+    
+    def log_command(self, update: Update, command: str, query: str = ""):
+        """Log command usage"""
+        user = update.effective_user
+        chat = update.effective_chat
+
+        chat_info = "private" if chat.type == "private" else f"group: {chat.title}"
+        logger.info("cmd=/%s user=%s [%s] chat=%s query=%r",
+                    command, user.first_name, user.id, chat_info, query)
+
+        # The pretty panel allocates a Table + Panel per command, so it's
+        # only rendered when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            user_info = f"{user.first_name}"
+            if user.username:
+                user_info += f" (@{user.username})"
+            user_info += f" [ID: {user.id}]"
+
+            table = Table(show_header=False, box=None, padding=(0, 1))
+            table.add_column("Label", style="bold cyan")
+            table.add_column("Value", style="white")
+
+            table.add_row("Command:", f"/{command}")
+            table.add_row("User:", user_info)
+            table.add_row("Chat:", chat_info)
+            if query:
+                table.add_row("Query:", query)
+
+            console.print(Panel(table, title="[green]Bot Activity[/green]",
+                              border_style="green"))
+    
+    def _get_reply_id(self, update: Update) -> Optional[int]:
+        """Get message ID to reply to if user is replying to someone"""
+        if update.message and update.message.reply_to_message:
+            return update.message.reply_to_message.message_id
+        return None
+    
+    async def _send_gif(
+        self, 
+        context: ContextTypes.DEFAULT_TYPE,
+        chat_id: int,
+        gif_url: str, 
+        caption: str,
+        reply_id: Optional[int] = None
+    ):
+        """Send GIF with proper reply handling"""
+        # Telegram fetches and re-encodes the GIF server-side, which can
+        # outlast the default timeouts on big files
+        await context.bot.send_animation(
+            chat_id=chat_id,
+            animation=gif_url,
+            caption=caption,
+            reply_to_message_id=reply_id,
+            read_timeout=30,
+            write_timeout=30
+        )
+    
+    async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Welcome message with features overview"""
+        await self.react_to_command(update, "start")
+        self.log_command(update, "start")
+        
+        await update.message.reply_text(WELCOME_TEXT)
+        
+        # Send welcome GIF
+        try:
+            welcome_gif = await self.cached_search("hello", limit=1)
+            if welcome_gif:
+                await update.message.reply_animation(
+                    welcome_gif[0],
+                    caption="Let's get started! What GIF adventure shall we begin today?"
+                )
+        except Exception as e:
+            logger.error(f"Error sending welcome GIF: {e}")
+    
+    async def group_welcome(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Send welcome message when bot is added to a group"""
+        if update.message.new_chat_members:
+            for member in update.message.new_chat_members:
+                if member.id == context.bot.id:
+                    await update.message.reply_text(GROUP_WELCOME_TEXT)
+                    # Send welcome GIF
+                    try:
+                        welcome_gif = await self.cached_search("group hello", limit=1)
+                        if welcome_gif:
+                            await update.message.reply_animation(welcome_gif[0])
+                    except Exception:
+                        pass
+    
+    async def about(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Show information about the bot creator"""
+        await self.react_to_command(update, "about")
+        self.log_command(update, "about")
+
+        await update.message.reply_text(ABOUT_TEXT)
+        
+        # Send a thank you GIF
+        try:
+            thanks_gif = await self.cached_search("thank you", limit=1)
+            if thanks_gif:
+                await update.message.reply_animation(
+                    thanks_gif[0],
+                    caption="Thanks for being awesome!"
+                )
+        except Exception as e:
+            logger.error(f"Error sending thanks GIF: {e}")
+    
+    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Detailed help with interactive buttons"""
+        await self.react_to_command(update, "help")
+        self.log_command(update, "help")
         
-        text = help_texts.get(query.data, "Oops! Help topic not found 😅 Try another one!")
-        back_button = InlineKeyboardButton("🔙 Back to Main Help", callback_data="help_main")
+        help_text = "🌈 GIF Bot Help Center\n\nChoose a category to learn more:"
+
+        await update.message.reply_text(help_text, reply_markup=HELP_MARKUP)
+    
+    async def help_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle help category selections"""
+        query = update.callback_query
+        await query.answer()
         
-        await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup([[back_button]]))
+        text = HELP_TEXTS.get(query.data, "Oops! Help topic not found 😅 Try another one!")
+
+        await query.edit_message_text(text, reply_markup=HELP_BACK_MARKUP)
     
     async def search_gif(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Main GIF search command"""
-        await self.react_to_command(update, "s")
-        
         if not context.args:
             await update.message.reply_text("Oops! You forgot to tell me what to search for!\nTry: /s cats dancing")
             return
@@ -477,28 +708,31 @@ Note: Group admin commands work in groups only
                 return
         else:
             query_parts = context.args
-            count = self.group_settings[str(update.effective_chat.id)]['max_gifs']
+            count = self.chat_settings(update.effective_chat.id)['max_gifs']
         
         query = ' '.join(query_parts)
         self.log_command(update, "search", f"{query} (count: {count})")
         
-        # Show typing action
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
-        
+        # Fire the typing action without waiting so its round-trip
+        # overlaps the Tenor search instead of preceding it
+        context.application.create_task(
+            context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
+        )
+
         try:
             # Search for GIFs
-            safe_mode = self.group_settings[str(update.effective_chat.id)]['safe_mode']
+            safe_mode = self.chat_settings(update.effective_chat.id)['safe_mode']
             
             # For single GIF, get 10 and pick randomly
             if count == 1:
-                gifs = await self.tenor.search_gif(query, limit=10, safe_search=safe_mode)
+                gifs = await self.cached_search(query, limit=10, safe_search=safe_mode)
                 if gifs:
                     gif_url = random.choice(gifs)
                     gifs = [gif_url]  # Convert to list for consistency
                 else:
                     gifs = []
             else:
-                gifs = await self.tenor.search_gif(query, limit=count, safe_search=safe_mode)
+                gifs = await self.cached_search(query, limit=count, safe_search=safe_mode)
             
             if not gifs:
                 await update.message.reply_text(f'No GIFs found for "{query}" 😢\nTry something else?')
@@ -508,13 +742,22 @@ Note: Group admin commands work in groups only
             reply_id = self._get_reply_id(update)
             chat_id = update.effective_chat.id
             
-            # Send GIFs
-            for i, gif_url in enumerate(gifs):
-                caption = f"Result {i+1} for {query}" if len(gifs) > 1 else f"{query}"
-                await self._send_gif(context, chat_id, gif_url, caption, reply_id)
+            # Send GIFs concurrently so the round-trips overlap
+            # (sendMediaGroup doesn't accept animations, so each one is
+            # its own message); one bad URL doesn't cancel the rest
+            await asyncio.gather(
+                *(
+                    self._send_gif(
+                        context, chat_id, gif_url,
+                        query if i == 0 else None, reply_id
+                    )
+                    for i, gif_url in enumerate(gifs)
+                ),
+                return_exceptions=True
+            )
             
             # Update stats
-            self.user_stats[str(update.effective_user.id)] += len(gifs)
+            self.user_stats[update.effective_user.id] += len(gifs)
             self.save_data()
             
         except Exception as e:
@@ -523,8 +766,6 @@ Note: Group admin commands work in groups only
     
     async def random_gif(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Send a random GIF from query"""
-        await self.react_to_command(update, "r")
-        
         if not context.args:
             await update.message.reply_text("Tell me what to find randomly!\nExample: /r cats being weird")
             return
@@ -532,11 +773,14 @@ Note: Group admin commands work in groups only
         query = ' '.join(context.args)
         self.log_command(update, "random", query)
         
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
-        
+        # Typing indicator overlaps the search rather than preceding it
+        context.application.create_task(
+            context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
+        )
+
         try:
-            safe_mode = self.group_settings[str(update.effective_chat.id)]['safe_mode']
-            gifs = await self.tenor.search_gif(query, limit=20, safe_search=safe_mode)
+            safe_mode = self.chat_settings(update.effective_chat.id)['safe_mode']
+            gifs = await self.cached_search(query, limit=20, safe_search=safe_mode)
             
             if not gifs:
                 await update.message.reply_text(f'No GIFs found for "{query}" 😢')
@@ -556,7 +800,7 @@ Note: Group admin commands work in groups only
                 reply_id
             )
             
-            self.user_stats[str(update.effective_user.id)] += 1
+            self.user_stats[update.effective_user.id] += 1
             self.save_data()
             
         except Exception as e:
@@ -571,14 +815,15 @@ Note: Group admin commands work in groups only
             await update.message.reply_text("Reply to a GIF with /fav_add to save it!")
             return
         
-        user_id = str(update.effective_user.id)
+        user_id = update.effective_user.id
         gif_file_id = update.message.reply_to_message.animation.file_id
         
-        if gif_file_id in self.favorites[user_id]:
+        if gif_file_id in self._fav_sets.get(user_id, ()):
             await update.message.reply_text("This GIF is already in your favorites!")
             return
-        
+
         self.favorites[user_id].append(gif_file_id)
+        self._fav_sets[user_id].add(gif_file_id)
         self.save_data()
         
         await update.message.reply_text(
@@ -590,9 +835,9 @@ Note: Group admin commands work in groups only
     
     async def list_favorites(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """List user's favorite GIFs"""
-        await self.react_to_command(update, "fav_list")
-        user_id = str(update.effective_user.id)
-        user_favs = self.favorites[user_id]
+        user_id = update.effective_user.id
+        # .get read so /fav_list from a new user doesn't materialize an entry
+        user_favs = self.favorites.get(user_id, [])
         
         if not user_favs:
             await update.message.reply_text("You don't have any favorite GIFs yet!\nReply to a GIF with /fav_add to save it.")
@@ -611,19 +856,29 @@ Note: Group admin commands work in groups only
             reply_to_message_id=reply_id
         )
         
-        for i, gif_file_id in enumerate(user_favs[:10]):  # Show max 10
-            try:
-                await context.bot.send_animation(
+        shown = user_favs[:10]  # Show max 10
+
+        # Concurrent individual sends (sendMediaGroup doesn't accept
+        # animations, so there's no album shortcut here)
+        results = await asyncio.gather(
+            *(
+                context.bot.send_animation(
                     chat_id=chat_id,
                     animation=gif_file_id,
                     caption=f"Favorite #{i+1}",
                     reply_to_message_id=reply_id
                 )
-            except Exception as e:
-                logger.error(f"Error sending favorite GIF: {e}")
-                # If GIF is no longer accessible, remove it
-                if gif_file_id in self.favorites[user_id]:
-                    self.favorites[user_id].remove(gif_file_id)
+                for i, gif_file_id in enumerate(shown)
+            ),
+            return_exceptions=True
+        )
+
+        # Prune GIFs that are no longer accessible in a single pass
+        bad = {shown[i] for i, r in enumerate(results) if isinstance(r, Exception)}
+        if bad:
+            logger.error(f"Removing {len(bad)} inaccessible favorite GIFs")
+            self.favorites[user_id] = [f for f in user_favs if f not in bad]
+            self._fav_sets[user_id] -= bad
         
         if len(user_favs) > 10:
             await context.bot.send_message(
@@ -642,14 +897,15 @@ Note: Group admin commands work in groups only
             await update.message.reply_text("Usage: /fav_remove [number]\nExample: /fav_remove 2")
             return
         
-        user_id = str(update.effective_user.id)
+        user_id = update.effective_user.id
         index = int(context.args[0]) - 1
         
-        if index < 0 or index >= len(self.favorites[user_id]):
+        if index < 0 or index >= len(self.favorites.get(user_id, ())):
             await update.message.reply_text("Invalid favorite number! Check with /fav_list")
             return
         
         removed = self.favorites[user_id].pop(index)
+        self._fav_sets[user_id].discard(removed)
         self.save_data()
         
         await update.message.reply_text(f"Favorite #{index+1} removed!")
@@ -684,9 +940,13 @@ Note: Group admin commands work in groups only
             return
         
         await self.react_to_command(update, "toggle_passive")
-        chat_id = str(update.effective_chat.id)
+        chat_id = update.effective_chat.id
         current = self.group_settings[chat_id]['passive_mode']
         self.group_settings[chat_id]['passive_mode'] = not current
+        if current:
+            self._passive_chats.discard(chat_id)
+        else:
+            self._passive_chats.add(chat_id)
         self.save_data()
         
         status = "enabled" if not current else "disabled"
@@ -708,7 +968,7 @@ Note: Group admin commands work in groups only
             return
         
         max_count = min(int(context.args[0]), 5)
-        chat_id = str(update.effective_chat.id)
+        chat_id = update.effective_chat.id
         self.group_settings[chat_id]['max_gifs'] = max_count
         self.save_data()
         
@@ -721,7 +981,7 @@ Note: Group admin commands work in groups only
             return
         
         await self.react_to_command(update, "safe")
-        chat_id = str(update.effective_chat.id)
+        chat_id = update.effective_chat.id
         current = self.group_settings[chat_id]['safe_mode']
         self.group_settings[chat_id]['safe_mode'] = not current
         self.save_data()
@@ -733,8 +993,7 @@ Note: Group admin commands work in groups only
     
     async def show_user_stats(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show user statistics"""
-        await self.react_to_command(update, "stats")
-        user_id = str(update.effective_user.id)
+        user_id = update.effective_user.id
         user_count = self.user_stats.get(user_id, 0)
         fav_count = len(self.favorites.get(user_id, []))
         
@@ -779,26 +1038,30 @@ Note: Group admin commands work in groups only
             await update.message.reply_text("This command only works in groups!")
             return
         
-        # Get all users who have used the bot in this group
-        # Note: This is a simplified approach - in a real bot you'd track per-group stats
-        group_users = {}
-        
         # This is a placeholder - in a real implementation you'd need to track per-group usage
-        # For now, we'll show global top users
-        sorted_users = sorted(self.user_stats.items(), key=lambda x: x[1], reverse=True)[:10]
-        
-        if not sorted_users:
+        # For now, we'll show global top users. nlargest keeps only the
+        # top 10 instead of sorting the whole stats dict
+        top_users = heapq.nlargest(10, self.user_stats.items(), key=lambda kv: kv[1])
+
+        if not top_users:
             await update.message.reply_text("No stats available yet!")
             return
-        
+
+        # Resolve all names concurrently instead of one round-trip each
+        members = await asyncio.gather(
+            *(
+                context.bot.get_chat_member(update.effective_chat.id, user_id)
+                for user_id, _ in top_users
+            ),
+            return_exceptions=True
+        )
+
         response = "🏆 Top GIF Users:\n\n"
-        for i, (user_id, count) in enumerate(sorted_users):
-            try:
-                user = await context.bot.get_chat_member(update.effective_chat.id, int(user_id))
-                name = user.user.first_name
-                response += f"{i+1}. {name}: {count} GIFs\n"
-            except:
+        for i, ((user_id, count), member) in enumerate(zip(top_users, members)):
+            if isinstance(member, Exception):
                 response += f"{i+1}. User {user_id}: {count} GIFs\n"
+            else:
+                response += f"{i+1}. {member.user.first_name}: {count} GIFs\n"
         
         await update.message.reply_text(response)
         self.log_command(update, "ranking")
@@ -808,55 +1071,98 @@ Note: Group admin commands work in groups only
         if not update.message or not update.message.text:
             return
         
-        chat_id = str(update.effective_chat.id)
-        if not self.group_settings[chat_id]['passive_mode']:
+        # One set lookup rejects chats without passive mode before any
+        # dict access; the set is kept in sync by load_data/toggle_passive
+        chat_id = update.effective_chat.id
+        if chat_id not in self._passive_chats:
             return
-        
-        message_text = update.message.text.lower()
-        
-        for trigger, queries in self.triggers.items():
-            if trigger in message_text:
-                # Send a random GIF from trigger queries
-                query = random.choice(queries)
-                
+        settings = self.group_settings.get(chat_id, DEFAULT_GROUP_SETTINGS)
+
+        # The Regex pre-filter guarantees a trigger is present, but search
+        # again to know which one matched
+        match = TRIGGER_RE.search(update.message.text)
+        if not match:
+            return
+
+        trigger = match.group(1).lower()
+
+        # Queue the reply per chat: a slow Tenor call in one chat no
+        # longer stalls its own later messages out of order, and other
+        # chats proceed on their own workers
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = self._chat_queues[chat_id] = asyncio.Queue()
+        queue.put_nowait(self._respond_to_trigger(update, trigger, settings))
+
+        if chat_id not in self._chat_workers:
+            self._chat_workers[chat_id] = asyncio.create_task(
+                self._drain_chat_queue(chat_id)
+            )
+
+    async def _drain_chat_queue(self, chat_id: int):
+        """Run queued trigger replies for one chat in order, then exit"""
+        queue = self._chat_queues[chat_id]
+        try:
+            while True:
                 try:
-                    safe_mode = self.group_settings[chat_id]['safe_mode']
-                    gifs = await self.tenor.search_gif(query, limit=5, safe_search=safe_mode)
-                    
-                    if gifs:
-                        gif = random.choice(gifs)
-                        await update.message.reply_animation(
-                            gif,
-                            caption=f"{trigger}"
-                        )
-                        
-                        self.user_stats[str(update.effective_user.id)] += 1
-                        self.save_data()
+                    coro = queue.get_nowait()
+                except asyncio.QueueEmpty:
                     break
-                except Exception as e:
-                    logger.error(f"Passive trigger error: {e}")
+                await coro
+        finally:
+            del self._chat_workers[chat_id]
+
+    async def _respond_to_trigger(self, update: Update, trigger: str, settings: Dict):
+        """Search and send the GIF reply for one passive trigger"""
+        _choice = random.choice
+        query = _choice(self.triggers[trigger])
+
+        try:
+            gifs = await self.cached_search(query, limit=5, safe_search=settings['safe_mode'])
+
+            if gifs:
+                gif = _choice(gifs)
+                await update.message.reply_animation(
+                    gif,
+                    caption=f"{trigger}"
+                )
+
+                self.user_stats[update.effective_user.id] += 1
+                self.save_data()
+        except Exception as e:
+            logger.error(f"Passive trigger error: {e}")
     
     async def is_admin(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
         """Check if user is admin"""
         if update.effective_chat.type == "private":
             return True
-        
-        try:
-            member = await context.bot.get_chat_member(update.effective_chat.id, update.effective_user.id)
-            is_admin = member.status in ['administrator', 'creator']
-            
-            if not is_admin:
-                await update.message.reply_text("This command is for admins only!")
-            
-            return is_admin
-        except Exception as e:
-            logger.error(f"Admin check error: {e}")
-            return False
+
+        key = (update.effective_chat.id, update.effective_user.id)
+        cached = self._admin_cache.get(key)
+        if cached and time.monotonic() < cached[1]:
+            is_admin = cached[0]
+        else:
+            try:
+                member = await context.bot.get_chat_member(update.effective_chat.id, update.effective_user.id)
+                is_admin = member.status in ['administrator', 'creator']
+                self._admin_cache[key] = (is_admin, time.monotonic() + ADMIN_CACHE_TTL)
+            except Exception as e:
+                logger.error(f"Admin check error: {e}")
+                return False
+
+        if not is_admin:
+            await update.message.reply_text("This command is for admins only!")
+
+        return is_admin
+
+    async def handle_member_update(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Drop cached admin status when a member's status changes"""
+        member = update.chat_member
+        if member:
+            self._admin_cache.pop((member.chat.id, member.new_chat_member.user.id), None)
     
     async def quick_react(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Send a reaction GIF based on emoji"""
-        await self.react_to_command(update, "react")
-        
         if not context.args:
             emoji_list = "\n".join([f"{emoji}" for emoji in self.quick_reactions.keys()])
             await update.message.reply_text(
@@ -880,12 +1186,15 @@ Note: Group admin commands work in groups only
         query = self.quick_reactions[emoji]
         self.log_command(update, "react", emoji)
         
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
-        
+        # Typing indicator overlaps the search rather than preceding it
+        context.application.create_task(
+            context.bot.send_chat_action(chat_id=update.effective_chat.id, action=ChatAction.TYPING)
+        )
+
         try:
-            safe_mode = self.group_settings[str(update.effective_chat.id)]['safe_mode']
-            gifs = await self.tenor.search_gif(query, limit=10, safe_search=safe_mode)
-            
+            safe_mode = self.chat_settings(update.effective_chat.id)['safe_mode']
+            gifs = await self.cached_search(query, limit=10, safe_search=safe_mode)
+
             if not gifs:
                 await update.message.reply_text(f"Couldn't find a reaction GIF for {emoji}")
                 return
@@ -904,7 +1213,7 @@ Note: Group admin commands work in groups only
                 reply_id
             )
             
-            self.user_stats[str(update.effective_user.id)] += 1
+            self.user_stats[update.effective_user.id] += 1
             self.save_data()
             
         except Exception as e:
@@ -932,25 +1241,25 @@ Note: Group admin commands work in groups only
         chat_id = update.effective_chat.id
         
         # Create challenge
-        self.challenges[str(chat_id)] = {
+        end_time = datetime.now() + timedelta(seconds=seconds)
+        self.challenges[chat_id] = {
             "theme": theme,
             "creator": update.effective_user.id,
             "participants": {},
-            "end_time": datetime.now() + timedelta(seconds=seconds)
+            "end_time": end_time
         }
         self.save_data()
-        
-        duration = timedelta(seconds=seconds)
+
         hours, remainder = divmod(seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        time_str = f"{hours}h {minutes}m {seconds}s" if hours else f"{minutes}m {seconds}s"
-        
+        minutes, secs = divmod(remainder, 60)
+        time_str = f"{hours}h {minutes}m {secs}s" if hours else f"{minutes}m {secs}s"
+
         await update.message.reply_text(
             f"🏆 NEW GIF CHALLENGE!\n\n"
             f"Theme: {theme}\n"
             f"Duration: {time_str}\n"
             f"Submit your GIFs with /submitgif\n"
-            f"Ends at: {self.challenges[str(chat_id)]['end_time'].strftime('%H:%M:%S')}"
+            f"Ends at: {end_time.strftime('%H:%M:%S')}"
         )
         self.log_command(update, "challenge", f"{theme} {seconds}s")
         
@@ -959,13 +1268,14 @@ Note: Group admin commands work in groups only
             self.end_challenge,
             seconds,
             chat_id=chat_id,
+            name=f"challenge_{chat_id}",
             data={"chat_id": chat_id}
         )
     
     async def end_challenge(self, context: ContextTypes.DEFAULT_TYPE):
         """End a challenge and announce results"""
         job = context.job
-        chat_id = str(job.chat_id)
+        chat_id = job.chat_id
         
         if chat_id not in self.challenges:
             return
@@ -981,28 +1291,24 @@ Note: Group admin commands work in groups only
             self.save_data()
             return
         
-        # Select a random winner
-        winner_id = random.choice(list(challenge["participants"].keys()))
-        winner_gif = challenge["participants"][winner_id]
+        # Select a random winner without copying every key into a list
+        participants = challenge["participants"]
+        winner_id = next(islice(participants, random.randrange(len(participants)), None))
+        winner_gif = participants[winner_id]
         
         try:
-            winner = await context.bot.get_chat_member(chat_id, int(winner_id))
+            winner = await context.bot.get_chat_member(chat_id, winner_id)
             winner_name = winner.user.first_name
         except:
             winner_name = f"User {winner_id}"
         
-        await context.bot.send_message(
-            chat_id=chat_id,
-            text=f"🏆 Challenge '{challenge['theme']}' ended!\n\n"
-                 f"🎉 Winner: {winner_name}!\n"
-                 f"Thanks to all participants!"
-        )
-        
-        # Send winner's GIF
+        # One send carries both the announcement and the winning GIF
         await context.bot.send_animation(
             chat_id=chat_id,
             animation=winner_gif,
-            caption=f"🏆 Winning GIF by {winner_name}"
+            caption=f"🏆 Challenge '{challenge['theme']}' ended!\n\n"
+                    f"🎉 Winner: {winner_name}!\n"
+                    f"Thanks to all participants!"
         )
         
         # Cleanup
@@ -1012,7 +1318,7 @@ Note: Group admin commands work in groups only
     async def cancel_challenge(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Cancel an ongoing challenge"""
         await self.react_to_command(update, "cancelchallenge")
-        chat_id = str(update.effective_chat.id)
+        chat_id = update.effective_chat.id
         
         if chat_id not in self.challenges:
             await update.message.reply_text("No active challenge to cancel!")
@@ -1024,10 +1330,10 @@ Note: Group admin commands work in groups only
             await update.message.reply_text("Only the challenge creator or admin can cancel!")
             return
         
-        # Cancel scheduled job
-        for job in context.job_queue.jobs():
-            if job.data and job.data.get("chat_id") == chat_id:
-                job.schedule_removal()
+        # Cancel the scheduled end job by name instead of scanning
+        # every job in the queue
+        for job in context.job_queue.get_jobs_by_name(f"challenge_{chat_id}"):
+            job.schedule_removal()
         
         del self.challenges[chat_id]
         self.save_data()
@@ -1037,7 +1343,7 @@ Note: Group admin commands work in groups only
     async def submit_gif(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Submit a GIF for the current challenge"""
         await self.react_to_command(update, "submitgif")
-        chat_id = str(update.effective_chat.id)
+        chat_id = update.effective_chat.id
         
         if chat_id not in self.challenges:
             await update.message.reply_text("No active challenge! Start one with /challenge")
@@ -1051,7 +1357,7 @@ Note: Group admin commands work in groups only
         user_id = update.effective_user.id
         
         # Add submission
-        challenge["participants"][str(user_id)] = update.message.reply_to_message.animation.file_id
+        challenge["participants"][user_id] = update.message.reply_to_message.animation.file_id
         self.save_data()
         
         await update.message.reply_text(f"🎉 Submission received for '{challenge['theme']}' challenge!")
@@ -1073,19 +1379,22 @@ Note: Group admin commands work in groups only
         query = ' '.join(context.args[1:])
         
         # Validate time format
-        if not re.match(r"^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$", time_str):
+        match = HHMM_RE.match(time_str)
+        if not match:
             await update.message.reply_text("Invalid time format! Use HH:MM (24-hour format)\nExample: 14:30")
             return
-        
+
         self.log_command(update, "schedule", f"{time_str} {query}")
-        
+
         try:
-            # Calculate delay in seconds
+            # The regex already validated the fields, so read them out
+            # directly instead of going through strptime
             now = datetime.now()
-            scheduled_time = datetime.strptime(time_str, "%H:%M").replace(
-                year=now.year, month=now.month, day=now.day
+            scheduled_time = now.replace(
+                hour=int(match.group(1)), minute=int(match.group(2)),
+                second=0, microsecond=0
             )
-            
+
             # If time has already passed today, schedule for tomorrow
             if scheduled_time < now:
                 scheduled_time += timedelta(days=1)
@@ -1115,8 +1424,8 @@ Note: Group admin commands work in groups only
         chat_id = job.chat_id
         
         try:
-            safe_mode = self.group_settings.get(str(chat_id), {}).get('safe_mode', True)
-            gifs = await self.tenor.search_gif(query, limit=1, safe_search=safe_mode)
+            safe_mode = self.chat_settings(chat_id)['safe_mode']
+            gifs = await self.cached_search(query, limit=1, safe_search=safe_mode)
             
             if gifs:
                 await context.bot.send_animation(
@@ -1125,7 +1434,7 @@ Note: Group admin commands work in groups only
                     caption=f"⏰ Scheduled GIF for '{query}'"
                 )
                 # Update user stats
-                self.user_stats[str(job.data["user_id"])] += 1
+                self.user_stats[job.data["user_id"]] += 1
                 self.save_data()
             else:
                 await context.bot.send_message(
@@ -1137,28 +1446,20 @@ Note: Group admin commands work in groups only
 
     async def inspirational_quote(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Send an inspirational quote with a matching GIF"""
-        await self.react_to_command(update, "quote")
         topic = ' '.join(context.args) if context.args else "inspiration"
         self.log_command(update, "quote", topic)
 
         try:
-            import requests
-            # Get a random inspirational quote
-            response = requests.get("https://api.quotable.io/random")
-            if response.status_code == 200:
-                data = response.json()
-                quote_text = f'"{data["content"]}" — {data["author"]}'
-            else:
-                quote_text = "Believe you can and you're halfway there."
+            quote_text = await self._fetch_quote()
 
             # Get a GIF matching the topic
-            safe_mode = self.group_settings[str(update.effective_chat.id)]['safe_mode']
-            gifs = await self.tenor.search_gif(topic, limit=5, safe_search=safe_mode)
+            safe_mode = self.chat_settings(update.effective_chat.id)['safe_mode']
+            gifs = await self.cached_search(topic, limit=5, safe_search=safe_mode)
 
             if gifs:
                 gif_url = random.choice(gifs)
                 await update.message.reply_animation(gif_url, caption=quote_text)
-                self.user_stats[str(update.effective_user.id)] += 1
+                self.user_stats[update.effective_user.id] += 1
                 self.save_data()
             else:
                 await update.message.reply_text(quote_text)
@@ -1168,6 +1469,14 @@ Note: Group admin commands work in groups only
             
 def main():
     """Main function to run the bot"""
+    # Use the libuv event loop when available - a drop-in speedup for
+    # the socket-heavy asyncio work every command does
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Check for required environment variables
     token = os.getenv("TELEGRAM_BOT_TOKEN")
     tenor_key = os.getenv("TENOR_API_KEY")
@@ -1180,8 +1489,25 @@ def main():
     # Initialize bot
     bot = GIFBot()
     
-    # Create application
-    application = Application.builder().token(token).build()
+    # Create application - process updates concurrently and widen the
+    # outbound HTTP pool so busy chats don't block each other
+    application = (
+        Application.builder()
+        .token(token)
+        .concurrent_updates(True)
+        .rate_limiter(AIORateLimiter(
+            overall_max_rate=30, overall_time_period=1,
+            group_max_rate=20, group_time_period=60
+        ))
+        .connection_pool_size(64)
+        .pool_timeout(20)
+        .connect_timeout(10)
+        .read_timeout(20)
+        .write_timeout(20)
+        .post_init(bot.post_init)
+        .post_shutdown(bot.post_shutdown)
+        .build()
+    )
     
     # Add command handlers
     application.add_handler(CommandHandler("start", bot.start))
@@ -1218,11 +1544,18 @@ def main():
     application.add_handler(CommandHandler("setmax", bot.set_max_gifs))
     application.add_handler(CommandHandler("safe", bot.toggle_safe_mode))
     
-    # Message handlers
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot.handle_passive_triggers))
+    # Message handlers - the Regex pre-filter rejects non-trigger messages
+    # inside PTB's filter layer before our coroutine is ever scheduled
+    application.add_handler(MessageHandler(
+        filters.TEXT & ~filters.COMMAND & filters.Regex(TRIGGER_RE),
+        bot.handle_passive_triggers
+    ))
     
     # Group welcome handler
     application.add_handler(MessageHandler(filters.StatusUpdate.NEW_CHAT_MEMBERS, bot.group_welcome))
+
+    # Keep the admin cache honest when members get promoted/demoted
+    application.add_handler(ChatMemberHandler(bot.handle_member_update, ChatMemberHandler.CHAT_MEMBER))
     
     # Add enhanced features
     bot.enhanced.add_handlers(application)
@@ -1234,7 +1567,21 @@ def main():
         border_style="green"
     ))
     
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    # Prefer webhooks when a public URL is configured - Telegram pushes
+    # updates instead of us burning a getUpdates long-poll each cycle.
+    # Polling stays the default for local runs with no reverse proxy
+    webhook_url = os.getenv("WEBHOOK_URL")
+    if webhook_url:
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=int(os.getenv("PORT", "8443")),
+            url_path=token,
+            webhook_url=f"{webhook_url.rstrip('/')}/{token}",
+            secret_token=os.getenv("WEBHOOK_SECRET"),
+            allowed_updates=Update.ALL_TYPES
+        )
+    else:
+        application.run_polling(allowed_updates=Update.ALL_TYPES)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,258 @@
+"""
+Enhanced Features for GIF Bot
+Additional functionality including quotes and GIF labeling
+"""
+
+import asyncio
+import random
+from collections import deque
+from typing import Dict, List, Optional
+from telegram import Update
+from telegram.ext import ContextTypes
+from rich.console import Console
+
+console = Console()
+
+# Shared read-only pools; tuples so no instance or call rebuilds them
+MOTIVATIONAL_QUOTES = (
+    "The only way to do great work is to love what you do. - Steve Jobs",
+    "Innovation distinguishes between a leader and a follower. - Steve Jobs",
+    "Life is what happens to you while you're busy making other plans. - John Lennon",
+    "The future belongs to those who believe in the beauty of their dreams. - Eleanor Roosevelt",
+    "It is during our darkest moments that we must focus to see the light. - Aristotle",
+    "Success is not final, failure is not fatal: it is the courage to continue that counts. - Winston Churchill",
+    "The only impossible journey is the one you never begin. - Tony Robbins",
+    "In the midst of winter, I found there was, within me, an invincible summer. - Albert Camus",
+    "Be yourself; everyone else is already taken. - Oscar Wilde",
+    "Two roads diverged in a wood, and I— I took the one less traveled by. - Robert Frost"
+)
+
+RANDOM_QUERIES = (
+    'random', 'surprise', 'funny', 'cute', 'awesome',
+    'cool', 'amazing', 'wow', 'epic', 'crazy'
+)
+
+class EnhancedFeatures:
+    """Additional features for the GIF bot"""
+
+    def __init__(self, bot_instance):
+        self.bot = bot_instance
+
+        # Rolling buffer of prefetched GIF URLs so /random answers from
+        # memory instead of a live Tenor round-trip
+        self._random_pool = deque(maxlen=50)
+        self._pool_task = None
+
+    def start_background_tasks(self):
+        """Start the prefetch task (called once the event loop is running)"""
+        if self._pool_task is None:
+            self._pool_task = asyncio.create_task(self._refill_random_pool())
+
+    def stop_background_tasks(self):
+        """Cancel the prefetch task on shutdown"""
+        if self._pool_task:
+            self._pool_task.cancel()
+            self._pool_task = None
+
+    async def _refill_random_pool(self):
+        """Keep the random GIF buffer topped up in the background"""
+        while True:
+            try:
+                if len(self._random_pool) < 20:
+                    query = random.choice(RANDOM_QUERIES)
+                    gifs = await self.bot.tenor.search_gif(query, limit=20)
+                    self._random_pool.extend(gifs)
+            except Exception as e:
+                console.print(f"[red]❌ Random pool refill error: {e}[/red]")
+            await asyncio.sleep(30)
+
+    async def quote_with_gif(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Send an inspirational quote with a matching GIF"""
+        if not context.args:
+            query = "motivation"
+        else:
+            query = ' '.join(context.args)
+
+        self.bot.log_command(update, "quote", query)
+
+        # Get a random quote
+        quote = random.choice(MOTIVATIONAL_QUOTES)
+
+        # Search for a matching GIF
+        safe_mode = self.bot.chat_settings(update.effective_chat.id)['safe_mode']
+        gifs = await self.bot.tenor.search_gif(query, limit=5, safe_search=safe_mode)
+
+        await update.message.reply_text(
+            f"✨ **Daily Motivation** ✨\n\n*{quote}*",
+            parse_mode='Markdown'
+        )
+
+        if gifs:
+            gif = random.choice(gifs)
+            await update.message.reply_animation(
+                gif,
+                caption=f"🎬 *{query} vibes*",
+                parse_mode='Markdown'
+            )
+
+            self.bot.user_stats[update.effective_user.id] += 1
+            self.bot.save_data()
+
+    async def label_gif(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Label a GIF with a keyword for quick access"""
+        if not context.args:
+            await update.message.reply_text(
+                "🏷️ **Usage:** `/label [keyword]`\n"
+                "Reply to a GIF or use after sending one",
+                parse_mode='Markdown'
+            )
+            return
+
+        keyword = ' '.join(context.args).lower()
+        user_id = update.effective_user.id
+
+        gif_file_id = None
+
+        # Check if replying to a GIF
+        if update.message.reply_to_message and update.message.reply_to_message.animation:
+            gif_file_id = update.message.reply_to_message.animation.file_id
+        else:
+            await update.message.reply_text(
+                "🏷️ **Please reply to a GIF** with `/label [keyword]`",
+                parse_mode='Markdown'
+            )
+            return
+
+        # Save the label
+        if user_id not in self.bot.gif_labels:
+            self.bot.gif_labels[user_id] = {}
+
+        self.bot.gif_labels[user_id][keyword] = gif_file_id
+        self.bot.save_data()
+
+        await update.message.reply_text(
+            f"🏷️ **GIF labeled as '{keyword}'**\n"
+            f"Use `/gif {keyword}` to access it quickly!",
+            parse_mode='Markdown'
+        )
+
+        self.bot.log_command(update, "label", keyword)
+
+    async def quick_gif(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Send a labeled GIF by keyword"""
+        if not context.args:
+            user_id = update.effective_user.id
+            labels = list(self.bot.gif_labels.get(user_id, {}).keys())
+
+            if not labels:
+                await update.message.reply_text(
+                    "🏷️ **No labeled GIFs yet!**\n"
+                    "Reply to any GIF with `/label [keyword]` to save it",
+                    parse_mode='Markdown'
+                )
+                return
+
+            labels_text = ', '.join(labels[:10])
+            await update.message.reply_text(
+                f"🏷️ **Your labeled GIFs:**\n`{labels_text}`\n"
+                f"\n**Usage:** `/gif [keyword]`",
+                parse_mode='Markdown'
+            )
+            return
+
+        keyword = ' '.join(context.args).lower()
+        user_id = update.effective_user.id
+
+        gif_file_id = self.bot.gif_labels.get(user_id, {}).get(keyword)
+
+        if not gif_file_id:
+            await update.message.reply_text(
+                f"🏷️ **No GIF labeled '{keyword}'**\n"
+                f"Use `/gif` to see your labeled GIFs",
+                parse_mode='Markdown'
+            )
+            return
+
+        try:
+            await update.message.reply_animation(
+                gif_file_id,
+                caption=f"🏷️ **{keyword}**",
+                parse_mode='Markdown'
+            )
+
+            self.bot.user_stats[update.effective_user.id] += 1
+            self.bot.save_data()
+
+        except Exception:
+            # GIF is no longer accessible, remove the label
+            del self.bot.gif_labels[user_id][keyword]
+            self.bot.save_data()
+            await update.message.reply_text(
+                f"🏷️ **'{keyword}' GIF is no longer available**\n"
+                f"It has been removed from your labels",
+                parse_mode='Markdown'
+            )
+
+        self.bot.log_command(update, "gif", keyword)
+
+    async def gif_info(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Show information about a GIF"""
+        if not update.message.reply_to_message or not update.message.reply_to_message.animation:
+            await update.message.reply_text(
+                "📊 **Reply to a GIF** with `/info` to get details",
+                parse_mode='Markdown'
+            )
+            return
+
+        gif = update.message.reply_to_message.animation
+
+        # Convert file size to MB
+        file_size_mb = round(gif.file_size / (1024 * 1024), 2) if gif.file_size else "Unknown"
+
+        info_text = f"""
+📊 **GIF Information**
+
+📏 **Dimensions:** {gif.width} × {gif.height}
+⏱️ **Duration:** {gif.duration}s
+💾 **File Size:** {file_size_mb} MB
+🆔 **File ID:** `{gif.file_id[:20]}...`
+        """
+
+        await update.message.reply_text(info_text, parse_mode='Markdown')
+        self.bot.log_command(update, "info")
+
+    async def random_trigger(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Send a completely random GIF"""
+        # Serve from the prefetched pool when possible; fall back to a
+        # live search if the refill task hasn't caught up
+        if self._random_pool:
+            gif = self._random_pool.popleft()
+        else:
+            query = random.choice(RANDOM_QUERIES)
+            safe_mode = self.bot.chat_settings(update.effective_chat.id)['safe_mode']
+            gifs = await self.bot.tenor.search_gif(query, limit=20, safe_search=safe_mode)
+            gif = random.choice(gifs) if gifs else None
+
+        if gif:
+            await update.message.reply_animation(
+                gif,
+                caption="🎲 **Random GIF!**",
+                parse_mode='Markdown'
+            )
+
+            self.bot.user_stats[update.effective_user.id] += 1
+            self.bot.save_data()
+        else:
+            await update.message.reply_text("🎲 Couldn't find a random GIF right now!")
+
+        self.bot.log_command(update, "random")
+
+    def add_handlers(self, application):
+        """Register enhanced feature handlers"""
+        from telegram.ext import CommandHandler
+
+        application.add_handler(CommandHandler("quote", self.quote_with_gif))
+        application.add_handler(CommandHandler("label", self.label_gif))
+        application.add_handler(CommandHandler("gif", self.quick_gif))
+        application.add_handler(CommandHandler("info", self.gif_info))
+        application.add_handler(CommandHandler("random", self.random_trigger))
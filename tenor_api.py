@@ -0,0 +1,336 @@
+"""
+Tenor API Handler for GIF Bot
+Handles all Tenor API interactions with error handling and rate limiting
+"""
+
+import os
+import time
+import random
+import logging
+import weakref
+import aiohttp
+import asyncio
+from functools import lru_cache
+from typing import List, Optional
+
+# orjson decodes Tenor's payloads a few times faster than stdlib json;
+# fall back transparently when it isn't installed
+try:
+    import orjson
+
+    def _json_loads(raw: bytes) -> dict:
+        return orjson.loads(raw)
+except ImportError:
+    import json
+
+    def _json_loads(raw: bytes) -> dict:
+        return json.loads(raw)
+
+logger = logging.getLogger("tenor")
+
+# Seconds a cached response stays fresh, per endpoint; trending moves
+# faster than search results for a given query
+CACHE_TTLS = {'search': 300, 'trending': 60}
+CACHE_MAX = 512
+
+
+@lru_cache(maxsize=64)
+def _search_params(limit: int, safe_search: bool) -> dict:
+    """Base search params for a (limit, safe_search) pair; copy before use"""
+    return {
+        'limit': min(limit, 50),
+        # Only ask for the two formats we actually use; trims the
+        # response payload considerably
+        'media_filter': 'gif,tinygif',
+        'contentfilter': 'high' if safe_search else 'off'
+    }
+
+
+@lru_cache(maxsize=8)
+def _trending_params(limit: int) -> dict:
+    """Base trending params for a limit; copy before use"""
+    return {
+        'limit': min(limit, 50),
+        'media_filter': 'gif,tinygif'
+    }
+
+
+def _close_leaked_session(session: aiohttp.ClientSession):
+    """Finalizer fallback for instances discarded without close()"""
+    if session.closed:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop left to close it on (interpreter shutdown); the OS
+        # reclaims the sockets anyway
+        return
+    loop.create_task(session.close())
+
+
+def _extract_gif_urls(results: list) -> List[str]:
+    """Pull GIF URLs out of Tenor result items, best format first"""
+    return [
+        url
+        for item in results
+        if (formats := item.get('media_formats'))
+        if (fmt := formats.get('gif') or formats.get('tinygif'))
+        if (url := fmt.get('url'))
+    ]
+
+class TenorAPI:
+    """Async Tenor API handler with comprehensive features"""
+
+    def __init__(self):
+        self.api_key = os.getenv('TENOR_API_KEY')
+        self.base_url = "https://tenor.googleapis.com/v2"
+        # Full endpoint URLs built once instead of per request
+        self._urls = {
+            endpoint: f"{self.base_url}/{endpoint}"
+            for endpoint in ('search', 'trending')
+        }
+        self.session = None
+
+        # Recent responses keyed by (endpoint, sorted params)
+        self._cache = {}
+
+        # In-flight requests sharing the same cache key
+        self._inflight = {}
+
+        # Caps simultaneous requests to Tenor; created lazily so it
+        # binds to the running event loop
+        self._semaphore = None
+
+        # Tenor 'pos' cursors per query, so paging resumes where the
+        # last page ended instead of re-fetching the top hits
+        self._last_pos = {}
+
+    async def _get_session(self):
+        """Get or create the persistent aiohttp session"""
+        if self.session is None or self.session.closed:
+            # Keep connections (and their TLS handshakes) alive between
+            # requests; Tenor sets no cookies, so skip the jar entirely
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=10, connect=3),
+                cookie_jar=aiohttp.DummyCookieJar(),
+                # Ask for gzip explicitly; aiohttp decompresses it for us
+                headers={'Accept-Encoding': 'gzip'}
+            )
+            # Safety net so a forgotten instance still releases its
+            # connector instead of leaking TLS transports
+            weakref.finalize(self, _close_leaked_session, self.session)
+        return self.session
+
+    async def __aenter__(self) -> "TenorAPI":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _make_request(self, endpoint: str, params: dict) -> Optional[dict]:
+        """Make API request with error handling and a short TTL cache"""
+        if not self.api_key:
+            logger.error("TENOR_API_KEY not found!")
+            return None
+
+        # Cache key is built before the api key joins the params
+        ttl = CACHE_TTLS.get(endpoint, 0)
+        key = (endpoint, tuple(sorted(params.items())))
+        now = time.monotonic()
+        if ttl:
+            cached = self._cache.get(key)
+            if cached and now - cached[0] < ttl:
+                return cached[1]
+
+        # Coalesce concurrent identical requests onto one shared task;
+        # shield it so one cancelled caller doesn't kill it for the rest
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(endpoint, params, key, ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch(self, endpoint: str, params: dict, key: tuple, ttl: int) -> Optional[dict]:
+        """Perform the HTTP request behind _make_request and fill the cache"""
+        params['key'] = self.api_key
+        url = self._urls.get(endpoint) or f"{self.base_url}/{endpoint}"
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(
+                int(os.getenv('TENOR_MAX_CONCURRENCY', '16'))
+            )
+
+        # Revalidate an expired entry instead of re-downloading it when
+        # the server still has the same payload
+        stale = self._cache.get(key) if ttl else None
+        headers = {'If-None-Match': stale[2]} if stale and stale[2] else None
+
+        try:
+            session = await self._get_session()
+            async with self._semaphore:
+                async with session.get(url, params=params, headers=headers) as response:
+                    if response.status == 304 and stale:
+                        logger.debug("Tenor API: %s - 304 (revalidated)", endpoint)
+                        self._cache[key] = (time.monotonic(), stale[1], stale[2])
+                        return stale[1]
+                    if response.status == 200:
+                        data = _json_loads(await response.read())
+                        logger.debug("Tenor API: %s - %s", endpoint, response.status)
+                        if ttl:
+                            self._cache[key] = (time.monotonic(), data,
+                                                response.headers.get('ETag'))
+                            if len(self._cache) > CACHE_MAX:
+                                # One sweep dropping everything already expired
+                                cutoff = time.monotonic() - max(CACHE_TTLS.values())
+                                for expired in [k for k, v in self._cache.items() if v[0] < cutoff]:
+                                    del self._cache[expired]
+                        return data
+                    else:
+                        logger.warning("Tenor API error: %s", response.status)
+                        return None
+
+        except asyncio.TimeoutError:
+            logger.warning("Tenor API: request timeout")
+            return None
+        except Exception as e:
+            logger.error("Tenor API error: %s", e)
+            return None
+
+    async def search_gif(self, query: str, limit: int = 1, safe_search: bool = True,
+                         random_order: bool = False) -> List[str]:
+        """
+        Search for GIFs on Tenor
+
+        Args:
+            query: Search term
+            limit: Number of GIFs to return (max 50)
+            safe_search: Filter out NSFW content
+            random_order: Let Tenor shuffle the results server-side
+
+        Returns:
+            List of GIF URLs
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        # aiohttp percent-encodes params itself; quoting the query here
+        # would double-encode spaces and unicode
+        params = dict(_search_params(limit, safe_search), q=query)
+        if random_order:
+            params['random'] = 'true'
+
+        data = await self._make_request('search', params)
+
+        if not data or 'results' not in data:
+            return []
+
+        gifs = _extract_gif_urls(data['results'])
+        logger.debug("Found %d GIFs for %r", len(gifs), query)
+        return gifs
+
+    async def iter_search(self, query: str, batch: int = 20,
+                          safe_search: bool = True):
+        """
+        Yield successive pages of GIF URLs for a query
+
+        Carries Tenor's 'pos' cursor between pages (and between calls),
+        so each batch holds new results rather than the same top hits.
+
+        Args:
+            query: Search term
+            batch: GIFs per page (max 50)
+            safe_search: Filter out NSFW content
+        """
+        query = query.strip()
+        if not query:
+            return
+
+        pos = self._last_pos.get(query, '')
+        while True:
+            params = dict(_search_params(batch, safe_search), q=query)
+            if pos:
+                params['pos'] = pos
+
+            data = await self._make_request('search', params)
+            if not data or not data.get('results'):
+                # Exhausted (or failed): restart from the top next time
+                self._last_pos.pop(query, None)
+                return
+
+            pos = data.get('next', '')
+            self._last_pos[query] = pos
+            yield _extract_gif_urls(data['results'])
+
+            if not pos:
+                self._last_pos.pop(query, None)
+                return
+
+    async def search_many(self, queries: List[str], limit: int = 1,
+                          safe_search: bool = True) -> List[List[str]]:
+        """
+        Search several queries concurrently on the shared session
+
+        Args:
+            queries: Search terms
+            limit: Number of GIFs to return per query
+            safe_search: Filter out NSFW content
+
+        Returns:
+            One URL list per query, in the same order
+        """
+        return await asyncio.gather(
+            *(self.search_gif(q, limit, safe_search) for q in queries)
+        )
+
+    async def get_trending(self, limit: int = 10) -> List[str]:
+        """
+        Get trending GIFs from Tenor
+
+        Args:
+            limit: Number of GIFs to return
+
+        Returns:
+            List of trending GIF URLs
+        """
+        params = dict(_trending_params(limit))
+
+        data = await self._make_request('trending', params)
+
+        if not data or 'results' not in data:
+            return []
+
+        gifs = _extract_gif_urls(data['results'])
+        logger.debug("Found %d trending GIFs", len(gifs))
+        return gifs
+
+    async def get_random_gif(self, query: str = 'random') -> Optional[str]:
+        """
+        Get a single random GIF for a query
+
+        Args:
+            query: Search term
+
+        Returns:
+            A random GIF URL or None
+        """
+        # Page through results with the stored cursor so repeated calls
+        # draw from fresh GIFs instead of one cached top page
+        async for gifs in self.iter_search(query):
+            if gifs:
+                return random.choice(gifs)
+        return None
+
+    async def close(self):
+        """Close the aiohttp session"""
+        if self.session and not self.session.closed:
+            await self.session.close()